@@ -1,16 +1,59 @@
 import os
+import io
 import re
 import json
+import asyncio
+from bisect import bisect_right
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from html import unescape
 from urllib.parse import urlparse, parse_qs
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
+import ahocorasick_rs
+import httpx
+import numpy as np
+import redis
+import redis.asyncio as aioredis
 import requests
+from requests.adapters import HTTPAdapter
+import zstandard as zstd
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from xml.etree import ElementTree as ET
+from fastapi.responses import ORJSONResponse
+from lxml import etree as LET
+from urllib3.util.retry import Retry
+
+# Shared async client: keeps connections to YouTube alive across requests
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+
+# Shared blocking session for the sync endpoints (scrape_links, oembed)
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; ClipSuggester/1.0)",
+    "Accept-Encoding": "gzip, deflate",
+}
+SESSION = requests.Session()
+SESSION.headers.update(DEFAULT_HEADERS)
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.2))
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await http_client.aclose()
+    SESSION.close()
+    if cache is not None:
+        await cache.aclose()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -47,9 +90,77 @@ def test_database():
     return response
 
 
+# ---------- Cache ----------
+
+# Optional Redis cache for transcripts; disabled when REDIS_URL is not set
+redis_url = os.getenv("REDIS_URL")
+cache = aioredis.Redis.from_url(redis_url) if redis_url else None
+TRANSCRIPT_TTL = 3600
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Return the decompressed cached value, or None on miss/unavailable cache"""
+    if cache is None:
+        return None
+    try:
+        data = await cache.get(key)
+    except redis.RedisError:
+        return None
+    return zstd.decompress(data) if data is not None else None
+
+
+async def cache_set(key: str, value: bytes, ttl: int = TRANSCRIPT_TTL) -> None:
+    """Store a zstd-compressed value; cache failures never fail the request"""
+    if cache is None:
+        return
+    try:
+        await cache.setex(key, ttl, zstd.compress(value))
+    except redis.RedisError:
+        pass
+
+
+# Process-local LRU of /suggest_clips results keyed by (video_id, lang, top_k);
+# the heuristic is deterministic for a given transcript
+CLIPS_CACHE_SIZE = 1024
+_clips_cache: "OrderedDict[Tuple[str, str, int], List[Dict[str, Any]]]" = OrderedDict()
+
+
+def clips_cache_get(key: Tuple[str, str, int]) -> Optional[List[Dict[str, Any]]]:
+    results = _clips_cache.get(key)
+    if results is not None:
+        _clips_cache.move_to_end(key)
+    return results
+
+
+def clips_cache_set(key: Tuple[str, str, int], results: List[Dict[str, Any]]) -> None:
+    _clips_cache[key] = results
+    _clips_cache.move_to_end(key)
+    if len(_clips_cache) > CLIPS_CACHE_SIZE:
+        _clips_cache.popitem(last=False)
+
+
 # ---------- Helpers ----------
 
+# Video ids embedded in YouTube page HTML (watch links and shorts)
+VIDEO_ID_RE = re.compile(r"(?:watch\?v=|/shorts/)([A-Za-z0-9_-]{11})")
+# A match is at most 19 chars, so this much tail catches ids split across chunks
+VIDEO_ID_CARRY = 18
+MAX_LINKS = 50
+# Common well-formed video URL shapes; anything else goes through urlparse.
+# Only the first v= parameter counts, matching parse_qs.
+YOUTUBE_URL_RE = re.compile(
+    r"^https?://(?:"
+    r"(?:www\.)?youtube\.com/(?:watch\?(?:(?!v=)[^&#%]*&)*v=([A-Za-z0-9_-]{11})(?=[&#]|$)"
+    r"|shorts/([A-Za-z0-9_-]{11})(?=[?#]|$))"
+    r"|youtu\.be/([A-Za-z0-9_-]{11})(?=[?#]|$))"
+)
+
+
+@lru_cache(maxsize=4096)
 def extract_video_id(url: str) -> Optional[str]:
+    m = YOUTUBE_URL_RE.match(url)
+    if m:
+        return next(g for g in m.groups() if g)
     try:
         parsed = urlparse(url)
         if parsed.netloc.endswith("youtube.com"):
@@ -65,93 +176,247 @@ def extract_video_id(url: str) -> Optional[str]:
     return None
 
 
-def fetch_transcript_xml(video_id: str, lang: str = "en") -> Optional[str]:
-    # Try exact lang, then autosubs
-    endpoints = [
+async def fetch_transcript_xml(video_id: str, lang: str = "en") -> Optional[bytes]:
+    # Raw response bytes: the parser honours the document's declared encoding
+    key = f"tt:v2:{video_id}:{lang}"
+    cached = await cache_get(key)
+    if cached is not None:
+        return cached
+
+    # Try exact lang, then autosubs. Candidates are requested concurrently but
+    # awaited in priority order, so the first usable one returns immediately.
+    endpoints = list(dict.fromkeys([
         f"https://www.youtube.com/api/timedtext?v={video_id}&lang={lang}",
         f"https://www.youtube.com/api/timedtext?v={video_id}&lang={lang}&fmt=vtt",
         f"https://www.youtube.com/api/timedtext?v={video_id}&lang=en",
         f"https://www.youtube.com/api/timedtext?v={video_id}&lang=en&fmt=vtt",
-    ]
-    for url in endpoints:
-        r = requests.get(url, timeout=10)
-        if r.status_code == 200 and r.text.strip():
-            return r.text
+    ]))
+    tasks = [asyncio.create_task(http_client.get(url)) for url in endpoints]
+    try:
+        for task in tasks:
+            try:
+                r = await task
+            except Exception:
+                continue
+            if r.status_code == 200 and r.content.strip():
+                await cache_set(key, r.content)
+                return r.content
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Reap cancelled/failed requests so their errors are not logged as unretrieved
+        await asyncio.gather(*tasks, return_exceptions=True)
     return None
 
 
-def parse_timedtext(xml_text: str) -> List[Dict[str, Any]]:
+# Transcript as struct-of-arrays: (starts, durs, texts)
+Segments = Tuple[np.ndarray, np.ndarray, List[str]]
+
+
+def parse_timedtext(xml_bytes: bytes) -> Segments:
+    starts: List[float] = []
+    durs: List[float] = []
+    texts: List[str] = []
     try:
-        root = ET.fromstring(xml_text)
-        segments: List[Dict[str, Any]] = []
-        # Elements are <text start=".." dur="..">text</text>
-        for node in root.iter("text"):
-            start = float(node.attrib.get("start", "0"))
-            dur = float(node.attrib.get("dur", "0"))
+        buf = io.BytesIO(xml_bytes)
+        # Elements are <text start=".." dur="..">text</text>; parse incrementally
+        # and drop each node once consumed so the tree never grows.
+        for _, node in LET.iterparse(buf, events=("end",), tag="text", recover=True, huge_tree=False):
+            start = float(node.get("start", "0"))
+            dur = float(node.get("dur", "0"))
             # Unescape HTML entities and replace newlines
-            text = (node.text or "").replace("\n", " ")
-            segments.append({"start": start, "dur": dur, "end": start + dur, "text": text})
-        return segments
+            text = unescape((node.text or "").replace("\n", " "))
+            starts.append(start)
+            durs.append(dur)
+            texts.append(text)
+            node.clear()
+            while node.getprevious() is not None:
+                del node.getparent()[0]
     except Exception:
-        return []
+        starts, durs, texts = [], [], []
+    return np.array(starts, dtype=np.float64), np.array(durs, dtype=np.float64), texts
 
 
-def suggest_clips_from_segments(segments: List[Dict[str, Any]], min_len: float = 20.0, max_len: float = 60.0, top_k: int = 3) -> List[Dict[str, Any]]:
-    if not segments:
+def segments_to_dicts(starts: np.ndarray, durs: np.ndarray, texts: List[str]) -> List[Dict[str, Any]]:
+    """Expand the struct-of-arrays transcript back into JSON-friendly dicts."""
+    ends = starts + durs
+    return [
+        {"start": s, "dur": d, "end": e, "text": t}
+        for s, d, e, t in zip(starts.tolist(), durs.tolist(), ends.tolist(), texts)
+    ]
+
+
+KEYWORDS = (
+    "secret", "tips", "hack", "mistake", "story", "crazy", "insane", "unexpected",
+    "how to", "why", "what", "this is", "you need", "stop", "start", "learn",
+    "viral", "trick", "strategy", "trend", "money", "growth", "win", "best",
+)
+KEYWORD_MATCHER = ahocorasick_rs.AhoCorasick(KEYWORDS, matchkind=ahocorasick_rs.MatchKind.Standard)
+
+
+def keyword_hits(texts: List[str], win_i: np.ndarray, win_j: np.ndarray) -> np.ndarray:
+    """Count distinct KEYWORDS found in each window of segments [win_i, win_j].
+
+    The transcript is scanned once; a keyword counts for a window when one of
+    its matches lies entirely inside the window's joined, lowercased text.
+    """
+    lowered = [t.lower() for t in texts]
+    # Character span of every segment inside the space-joined transcript
+    seg_len = np.fromiter((len(t) for t in lowered), dtype=np.int64, count=len(lowered))
+    seg_hi = np.cumsum(seg_len + 1) - 1
+    seg_lo = seg_hi - seg_len
+    char_lo = seg_lo[win_i]
+    char_hi = seg_hi[win_j]
+
+    hits = np.zeros(len(win_i), dtype=np.int64)
+    matches = KEYWORD_MATCHER.find_matches_as_indexes(" ".join(lowered), overlapping=True)
+    if not matches:
+        return hits
+    found = np.array(matches, dtype=np.int64)
+    found = found[np.lexsort((found[:, 1], found[:, 0]))]
+    patterns, bounds = np.unique(found[:, 0], return_index=True)
+    for p, lo, hi in zip(patterns.tolist(), bounds.tolist(), bounds[1:].tolist() + [len(found)]):
+        # First match of this keyword starting inside each window
+        match_starts = found[lo:hi, 1]
+        k = np.searchsorted(match_starts, char_lo, side="left")
+        inside = k < len(match_starts)
+        first_end = match_starts[np.minimum(k, len(match_starts) - 1)] + len(KEYWORDS[p])
+        hits += inside & (first_end <= char_hi)
+    return hits
+
+
+async def load_segments(video_id: str, lang: str = "en") -> Optional[Segments]:
+    """Fetch and parse a transcript, or None when no transcript is available."""
+    # Bump the version whenever parse_timedtext output changes
+    # (v2: unescaped text, v3: declared encoding honoured)
+    key = f"seg:v3:{video_id}:{lang}"
+    cached = await cache_get(key)
+    if cached is not None:
+        data = json.loads(cached)
+        return np.array(data["starts"], dtype=np.float64), np.array(data["durs"], dtype=np.float64), data["texts"]
+
+    xml_bytes = await fetch_transcript_xml(video_id, lang)
+    if not xml_bytes:
+        return None
+    starts, durs, texts = parse_timedtext(xml_bytes)
+    payload = {"starts": starts.tolist(), "durs": durs.tolist(), "texts": texts}
+    await cache_set(key, json.dumps(payload).encode("utf-8"))
+    return starts, durs, texts
+
+
+def first_end_reaching(starts: np.ndarray, ends: np.ndarray, length: float) -> np.ndarray:
+    """For each i, the first j >= i with ``ends[j] - starts[i] >= length`` (n if none).
+
+    ``ends`` must be sorted. searchsorted compares ``end >= start + length``,
+    which can disagree with the subtraction at float boundaries, so the
+    result is nudged until it satisfies the subtraction form exactly.
+    """
+    n = len(ends)
+    first = np.arange(n)
+    k = np.maximum(np.searchsorted(ends, starts + length, side="left"), first)
+    while True:
+        # Step back while the previous segment already reaches length
+        prev = np.maximum(k - 1, 0)
+        back = (k > first) & (ends[prev] - starts >= length)
+        # Step forward while the current segment falls short
+        cur = np.minimum(k, n - 1)
+        forward = (k < n) & (ends[cur] - starts < length)
+        if not (back.any() or forward.any()):
+            return k
+        k = k - back + forward
+
+
+def suggest_clips_from_segments(starts: np.ndarray, durs: np.ndarray, texts: List[str], min_len: float = 20.0, max_len: float = 60.0, top_k: int = 3) -> List[Dict[str, Any]]:
+    if not texts:
         return []
 
     # Simple heuristic: build windows around pause boundaries and punctuation
-    keywords = [
-        "secret", "tips", "hack", "mistake", "story", "crazy", "insane", "unexpected",
-        "how to", "why", "what", "this is", "you need", "stop", "start", "learn",
-        "viral", "trick", "strategy", "trend", "money", "growth", "win", "best",
-    ]
+    ends = starts + durs
+    n = len(texts)
+    # Prefer to break on punctuation or on a pause before the next segment
+    breakable = np.fromiter((("." in t) or ("!" in t) or ("?" in t) for t in texts), dtype=bool, count=n)
+    breakable[:-1] |= starts[1:] - ends[:-1] > 0.6
+    starts_l, ends_l = starts.tolist(), ends.tolist()
+
+    windows: List[Tuple[int, int]] = []
+    if np.all(ends[1:] >= ends[:-1]):
+        # Sorted ends: for every window start i, segments [lo, hi) end between
+        # min_len and max_len after it, and the window closes at the first
+        # break point in that range.
+        lo = first_end_reaching(starts, ends, min_len)
+        hi = first_end_reaching(starts, ends, max_len)
+        # First break point at or after each index (n when there is none)
+        next_break = np.minimum.accumulate(np.where(breakable, np.arange(n), n)[::-1])[::-1]
+
+        lo_l, hi_l = lo.tolist(), hi.tolist()
+        next_break_l = next_break.tolist() + [n]
+        i = 0
+        while i < n:
+            j = next_break_l[lo_l[i]]
+            if j >= hi_l[i]:
+                # no break point before max_len: skip past the window
+                i = max(i + 1, hi_l[i])
+                continue
+            windows.append((i, j))
+            i = max(i + 1, j)  # move forward
+    else:
+        # Overlapping captions leave ends unsorted, so bounds cannot be
+        # searched; walk each window from its start instead.
+        breakable_l = breakable.tolist()
+        i = 0
+        while i < n:
+            start_t = starts_l[i]
+            j = i
+            while j < n and ends_l[j] - start_t < max_len:
+                if ends_l[j] - start_t >= min_len and breakable_l[j]:
+                    windows.append((i, j))
+                    break
+                j += 1
+            i = max(i + 1, j)  # move forward
+    if not windows:
+        return []
 
+    win_i, win_j = np.array(windows, dtype=np.int64).T
+    # Score by keyword hits and brevity
+    kw_scores = (2 * keyword_hits(texts, win_i, win_j)).tolist()
+    target_len = (min_len + max_len) / 2
     candidates: List[Dict[str, Any]] = []
-    n = len(segments)
-    i = 0
-    while i < n:
-        # start a window
-        j = i
-        window_text = []
-        start_t = segments[i]["start"]
-        while j < n and segments[j]["end"] - start_t < max_len:
-            window_text.append(segments[j]["text"])
-            # Prefer to break on punctuation and if we've exceeded min_len
-            if segments[j]["end"] - start_t >= min_len:
-                combined = " ".join(window_text)
-                if re.search(r"[.!?]", segments[j]["text"]) or (j + 1 < n and segments[j + 1]["start"] - segments[j]["end"] > 0.6):
-                    # Score by keyword hits and brevity
-                    kw_score = sum(2 for k in keywords if k in combined.lower())
-                    length_penalty = abs((segments[j]["end"] - start_t) - ((min_len + max_len) / 2)) / 10.0
-                    score = kw_score - length_penalty
-                    candidates.append({
-                        "start": round(start_t, 2),
-                        "end": round(segments[j]["end"], 2),
-                        "duration": round(segments[j]["end"] - start_t, 2),
-                        "text": combined.strip(),
-                        "score": score,
-                    })
-                    break
-            j += 1
-        i = max(i + 1, j)  # move forward
+    for (i, j), kw_score in zip(windows, kw_scores):
+        start_t = starts_l[i]
+        end_t = ends_l[j]
+        duration = end_t - start_t
+        length_penalty = abs(duration - target_len) / 10.0
+        candidates.append({
+            "start": round(start_t, 2),
+            "end": round(end_t, 2),
+            "duration": round(duration, 2),
+            "score": kw_score - length_penalty,
+            "window": (i, j),
+        })
 
-    # Deduplicate overlapping by greedy selection
+    # Deduplicate overlapping by greedy selection. Selected windows are kept
+    # sorted by start and never overlap, so only the neighbours around the
+    # insertion point can collide with a new candidate.
     candidates.sort(key=lambda x: x["score"], reverse=True)
     selected: List[Dict[str, Any]] = []
-    used = []
+    used_starts: List[float] = []
+    used_ends: List[float] = []
     for c in candidates:
         if len(selected) >= top_k:
             break
-        overlap = False
-        for u in used:
-            if not (c["end"] <= u["start"] or c["start"] >= u["end"]):
-                overlap = True
-                break
-        if not overlap:
-            selected.append(c)
-            used.append({"start": c["start"], "end": c["end"]})
-
+        pos = bisect_right(used_starts, c["start"])
+        if pos > 0 and c["start"] < used_ends[pos - 1] and c["end"] > used_starts[pos - 1]:
+            continue
+        if pos < len(used_starts) and c["end"] > used_starts[pos]:
+            continue
+        selected.append(c)
+        used_starts.insert(pos, c["start"])
+        used_ends.insert(pos, c["end"])
+
+    # Join window text only for the clips actually returned
+    for c in selected:
+        i, j = c.pop("window")
+        c["text"] = " ".join(texts[i:j + 1]).strip()
     return selected
 
 
@@ -160,27 +425,35 @@ def suggest_clips_from_segments(segments: List[Dict[str, Any]], min_len: float =
 @app.get("/scrape_links")
 def scrape_links(url: str = Query(..., description="YouTube channel, playlist, or page URL")):
     try:
-        r = requests.get(url, timeout=10, headers={
-            "User-Agent": "Mozilla/5.0 (compatible; ClipSuggester/1.0)"
-        })
+        r = SESSION.get(url, timeout=10, stream=True)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to fetch URL: {e}")
 
-    if r.status_code != 200:
-        raise HTTPException(status_code=400, detail=f"Non-200 status: {r.status_code}")
-
-    html = r.text
-    # Find video IDs in HTML
-    ids = set(re.findall(r"watch\\?v=([A-Za-z0-9_-]{11})", html))
-    short_ids = set(re.findall(r"/shorts/([A-Za-z0-9_-]{11})", html))
-    all_ids = list(ids.union(short_ids))
+    with r:
+        if r.status_code != 200:
+            raise HTTPException(status_code=400, detail=f"Non-200 status: {r.status_code}")
+        if r.encoding is None:
+            r.encoding = "utf-8"
+
+        # Find video IDs in HTML, stopping the download once enough are found
+        ids: Dict[str, None] = {}
+        tail = ""
+        try:
+            for chunk in r.iter_content(chunk_size=65536, decode_unicode=True):
+                buf = tail + chunk
+                ids.update(dict.fromkeys(VIDEO_ID_RE.findall(buf)))
+                if len(ids) >= MAX_LINKS:
+                    break
+                tail = buf[-VIDEO_ID_CARRY:]
+        except requests.RequestException as e:
+            raise HTTPException(status_code=400, detail=f"Failed to fetch URL: {e}")
 
-    links = [f"https://www.youtube.com/watch?v={vid}" for vid in all_ids]
-    return {"count": len(links), "links": links[:50]}  # limit to 50
+    links = [f"https://www.youtube.com/watch?v={vid}" for vid in ids][:MAX_LINKS]
+    return {"count": len(links), "links": links}
 
 
 @app.get("/transcript")
-def transcript(video_id: Optional[str] = None, url: Optional[str] = None, lang: str = "en"):
+async def transcript(video_id: Optional[str] = None, url: Optional[str] = None, lang: str = "en"):
     if not video_id and not url:
         raise HTTPException(status_code=400, detail="Provide video_id or url")
     if url and not video_id:
@@ -188,32 +461,39 @@ def transcript(video_id: Optional[str] = None, url: Optional[str] = None, lang:
     if not video_id:
         raise HTTPException(status_code=400, detail="Unable to extract video id")
 
-    xml_text = fetch_transcript_xml(video_id, lang)
-    if not xml_text:
-        return JSONResponse({"video_id": video_id, "segments": [], "available": False})
+    segments = await load_segments(video_id, lang)
+    if segments is None:
+        return ORJSONResponse({"video_id": video_id, "segments": [], "available": False})
 
-    segments = parse_timedtext(xml_text)
-    return {"video_id": video_id, "segments": segments, "available": True}
+    return ORJSONResponse({"video_id": video_id, "segments": segments_to_dicts(*segments), "available": True})
 
 
 @app.get("/suggest_clips")
-def suggest_clips(video_id: Optional[str] = None, url: Optional[str] = None, lang: str = "en", top_k: int = 3):
+async def suggest_clips(video_id: Optional[str] = None, url: Optional[str] = None, lang: str = "en", top_k: int = 3):
     if url and not video_id:
         video_id = extract_video_id(url)
     if not video_id:
         raise HTTPException(status_code=400, detail="Provide video_id or url")
 
-    xml_text = fetch_transcript_xml(video_id, lang)
-    if not xml_text:
-        return JSONResponse({"video_id": video_id, "clips": [], "available": False})
+    cache_key = (video_id, lang, top_k)
+    results = clips_cache_get(cache_key)
+    if results is not None:
+        return ORJSONResponse({"video_id": video_id, "clips": results, "available": True})
 
-    segments = parse_timedtext(xml_text)
-    clips = suggest_clips_from_segments(segments, top_k=top_k)
+    loaded = await load_segments(video_id, lang)
+    if loaded is None:
+        return ORJSONResponse({"video_id": video_id, "clips": [], "available": False})
 
-    # Gather lines within each clip window for subtitles
+    starts, durs, texts = loaded
+    clips = suggest_clips_from_segments(starts, durs, texts, top_k=top_k)
+
+    # Gather lines within each clip window for subtitles. Segments arrive in
+    # start order, so only the slice starting inside the clip can qualify.
     results = []
     for c in clips:
-        lines = [s for s in segments if s["start"] >= c["start"] and s["end"] <= c["end"]]
+        lo = int(np.searchsorted(starts, c["start"], side="left"))
+        hi = int(np.searchsorted(starts, c["end"], side="right"))
+        lines = [s for s in segments_to_dicts(starts[lo:hi], durs[lo:hi], texts[lo:hi]) if s["end"] <= c["end"]]
         results.append({
             "start": c["start"],
             "end": c["end"],
@@ -222,20 +502,35 @@ def suggest_clips(video_id: Optional[str] = None, url: Optional[str] = None, lan
             "lines": lines,
         })
 
-    return {"video_id": video_id, "clips": results, "available": True}
+    clips_cache_set(cache_key, results)
+    return ORJSONResponse({"video_id": video_id, "clips": results, "available": True})
 
 
-@app.get("/oembed")
-def oembed_proxy(url: str):
+OEMBED_MAX_AGE = 86400
+
+
+@lru_cache(maxsize=2048)
+def fetch_oembed(url: str) -> Dict[str, Any]:
     # Simple metadata proxy (title/thumbnail) using YouTube's oEmbed
     oembed_url = f"https://www.youtube.com/oembed?url={requests.utils.quote(url)}&format=json"
-    r = requests.get(oembed_url, timeout=10)
+    r = SESSION.get(oembed_url, timeout=10)
     if r.status_code != 200:
         raise HTTPException(status_code=400, detail="Failed to fetch metadata")
-    return JSONResponse(content=r.json())
+    return r.json()
+
+
+@app.get("/oembed")
+def oembed_proxy(url: str):
+    # oEmbed metadata is stable; let browsers and CDNs reuse it as well
+    return ORJSONResponse(
+        content=fetch_oembed(url),
+        headers={"Cache-Control": f"public, max-age={OEMBED_MAX_AGE}"},
+    )
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Multiple workers require the app as an import string
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers, loop="uvloop", http="httptools")
@@ -0,0 +1,41 @@
+import numpy as np
+
+from main import suggest_clips_from_segments
+
+
+def test_overlapping_captions_respect_min_len():
+    # A long first caption overlaps the later ones, so ends are not sorted
+    starts = np.array([0.0, 1.0, 4.0])
+    durs = np.array([30.0, 2.0, 2.0])
+    assert suggest_clips_from_segments(starts, durs, ["intro", "one.", "two."]) == []
+
+
+def test_overlapping_captions_break_after_min_len():
+    starts = np.array([0.0, 1.0, 4.0, 22.0])
+    durs = np.array([30.0, 2.0, 2.0, 3.0])
+    clips = suggest_clips_from_segments(starts, durs, ["intro", "one.", "two.", "three."])
+    assert [(c["start"], c["end"]) for c in clips] == [(0.0, 25.0)]
+
+
+def test_sorted_captions_min_len_uses_end_minus_start():
+    # 44.98 + 7.01 - 31.99 falls a hair under 20 s; the baseline rejects it
+    starts = np.array([31.99, 44.98])
+    durs = np.array([5.0, 7.01])
+    assert suggest_clips_from_segments(starts, durs, ["a", "b."]) == []
+
+
+def test_sorted_captions_max_len_uses_end_minus_start():
+    # 64.07 - 4.07 < 60 although 64.07 >= 4.07 + 60, so the first window may
+    # still close on the second segment
+    starts = np.array([4.07, 30.0])
+    durs = np.array([30.0 - 4.07, 64.07 - 30.0])
+    clips = suggest_clips_from_segments(starts, durs, ["how to", "b."])
+    assert [(c["start"], c["end"], c["text"]) for c in clips] == [(4.07, 64.07, "how to b.")]
+
+
+def test_sorted_captions_break_on_punctuation_after_min_len():
+    starts = np.array([0.0, 10.0, 21.0, 30.0, 45.0])
+    durs = np.array([10.0, 11.0, 9.0, 15.0, 10.0])
+    texts = ["start", "of the story", "this is it.", "more", "end."]
+    clips = suggest_clips_from_segments(starts, durs, texts, top_k=5)
+    assert [(c["start"], c["end"]) for c in clips] == [(0.0, 30.0)]
@@ -0,0 +1,58 @@
+import asyncio
+from types import SimpleNamespace
+
+import main
+
+
+def run_fetch(monkeypatch, responses, lang="en"):
+    """Fetch with a fake client; ``responses`` maps URL suffix -> (delay, status, body)."""
+    requested = []
+    cancelled = []
+
+    async def fake_get(url):
+        requested.append(url)
+        delay, status, body = responses[url.split("?", 1)[1]]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return SimpleNamespace(status_code=status, content=body)
+
+    monkeypatch.setattr(main, "cache", None)
+    monkeypatch.setattr(main.http_client, "get", fake_get)
+    result = asyncio.run(main.fetch_transcript_xml("abc", lang))
+    return result, requested, cancelled
+
+
+def test_default_lang_requests_each_url_once(monkeypatch):
+    responses = {
+        "v=abc&lang=en": (0, 404, b""),
+        "v=abc&lang=en&fmt=vtt": (0, 404, b""),
+    }
+    result, requested, _ = run_fetch(monkeypatch, responses)
+    assert result is None
+    assert len(requested) == 2
+
+
+def test_priority_hit_does_not_wait_for_slower_candidates(monkeypatch):
+    responses = {
+        "v=abc&lang=fr": (0, 200, b"<transcript/>"),
+        "v=abc&lang=fr&fmt=vtt": (5, 200, b"vtt"),
+        "v=abc&lang=en": (5, 200, b"<transcript/>"),
+        "v=abc&lang=en&fmt=vtt": (5, 200, b"vtt"),
+    }
+    result, _, cancelled = run_fetch(monkeypatch, responses, lang="fr")
+    assert result == b"<transcript/>"
+    assert len(cancelled) == 3
+
+
+def test_falls_back_in_priority_order(monkeypatch):
+    responses = {
+        "v=abc&lang=fr": (0.01, 404, b""),
+        "v=abc&lang=fr&fmt=vtt": (0.02, 200, b"second"),
+        "v=abc&lang=en": (0, 200, b"third"),
+        "v=abc&lang=en&fmt=vtt": (0, 200, b"fourth"),
+    }
+    result, _, _ = run_fetch(monkeypatch, responses, lang="fr")
+    assert result == b"second"
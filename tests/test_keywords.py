@@ -0,0 +1,33 @@
+import random
+
+import numpy as np
+
+from main import KEYWORDS, keyword_hits
+
+# Fragments that form keywords on their own, across segment joins, overlapping
+# each other, in mixed case, and next to characters whose lowercase form
+# changes string length
+FRAGMENTS = [
+    "how", "to", "How To", "this", "IS", "you", "need", "stop", "start", "win", "best",
+    "secretly", "whywhat", "tipstop", "besthis is", "crazy!", "money.",
+    "İ", "İstart", "É", "ß", "the", "", "  ",
+]
+
+
+def naive_hits(texts, i, j):
+    combined = " ".join(texts[i:j + 1]).lower()
+    return sum(1 for k in KEYWORDS if k in combined)
+
+
+def test_keyword_hits_matches_substring_scan():
+    rng = random.Random(0)
+    for _ in range(300):
+        texts = [
+            " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 4)))
+            for _ in range(rng.randint(1, 12))
+        ]
+        pairs = [(i, j) for i in range(len(texts)) for j in range(i, len(texts))]
+        win_i = np.array([p[0] for p in pairs], dtype=np.int64)
+        win_j = np.array([p[1] for p in pairs], dtype=np.int64)
+        expected = [naive_hits(texts, i, j) for i, j in pairs]
+        assert keyword_hits(texts, win_i, win_j).tolist() == expected
@@ -0,0 +1,48 @@
+import io
+
+import requests
+
+import main
+
+CHUNK = 65536
+
+
+class Body(io.BytesIO):
+    """Response body that remembers how far it was read before being closed."""
+
+    bytes_read = None
+
+    def close(self):
+        self.bytes_read = self.tell()
+        super().close()
+
+
+def make_response(body: bytes) -> requests.Response:
+    r = requests.Response()
+    r.status_code = 200
+    r.encoding = "utf-8"
+    r.raw = Body(body)
+    return r
+
+
+def test_scrape_links_spans_chunks_and_stops_at_max(monkeypatch):
+    ids = [f"id{n:09d}" for n in range(60)]
+    link = '<a href="/watch?v={}">x</a>'.format
+    head = "".join(link(v) if n % 2 else f'"/shorts/{v}"' for n, v in enumerate(ids[:49])).encode()
+    # Pad with multibyte characters so the 64 KiB byte boundary falls inside
+    # the 50th id rather than between matches
+    straddle = link(ids[49]).encode()
+    pad_len = CHUNK - len(head) - 12
+    padding = "é".encode() * (pad_len // 2) + b" " * (pad_len % 2)
+    body = head + padding + straddle
+    assert len(head) + len(padding) < CHUNK < len(body)
+    tail = "".join(link(v) for v in ids[50:]).encode() + b" " * (4 * CHUNK)
+    raw = make_response(body + tail)
+    monkeypatch.setattr(main.SESSION, "get", lambda url, **kwargs: raw)
+
+    result = main.scrape_links(url="https://www.youtube.com/@channel")
+
+    assert result["count"] == main.MAX_LINKS
+    assert result["links"] == [f"https://www.youtube.com/watch?v={v}" for v in ids[:50]]
+    # Download stopped once the 50th id arrived
+    assert raw.raw.bytes_read <= 2 * CHUNK
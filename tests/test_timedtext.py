@@ -0,0 +1,14 @@
+from main import parse_timedtext
+
+
+def test_parse_honours_declared_encoding():
+    xml = '<?xml version="1.0" encoding="ISO-8859-1"?><transcript><text start="1.5" dur="2">café</text></transcript>'
+    starts, durs, texts = parse_timedtext(xml.encode("iso-8859-1"))
+    assert starts.tolist() == [1.5]
+    assert durs.tolist() == [2.0]
+    assert texts == ["café"]
+
+
+def test_parse_unescapes_double_escaped_entities():
+    xml = b'<transcript><text start="0" dur="1">don&amp;#39;t\nstop</text></transcript>'
+    assert parse_timedtext(xml)[2] == ["don't stop"]
@@ -0,0 +1,46 @@
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from main import YOUTUBE_URL_RE, extract_video_id
+
+
+def urlparse_video_id(url: str) -> Optional[str]:
+    """Reference: the urlparse/parse_qs extraction the regex fast path must agree with."""
+    parsed = urlparse(url)
+    if parsed.netloc.endswith("youtube.com"):
+        if parsed.path == "/watch":
+            return parse_qs(parsed.query).get("v", [None])[0]
+        if parsed.path.startswith("/shorts/"):
+            return parsed.path.split("/")[-1]
+    if parsed.netloc == "youtu.be":
+        return parsed.path.strip("/")
+    return None
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.youtube.com/watch?v=ABCDEFGHIJK",
+    # repeated v=: parse_qs keeps the first value
+    "https://www.youtube.com/watch?v=ABCDEFGHIJK&v=ZZZZZZZZZZZ",
+    "https://www.youtube.com/watch?v=ab&v=ABCDEFGHIJK",
+    "https://www.youtube.com/watch?t=1&v=ABCDEFGHIJK&v=ZZZZZZZZZZZ",
+    # blank v= is dropped by parse_qs
+    "https://www.youtube.com/watch?v=&v=ABCDEFGHIJK",
+    # %-encoded id or key
+    "https://www.youtube.com/watch?v=ABCDEFGHIJ%4B",
+    "https://www.youtube.com/watch?%76=ab&v=ABCDEFGHIJK",
+    # trailing slash on shorts
+    "https://youtube.com/shorts/ABCDEFGHIJK/",
+    "https://youtube.com/shorts/ABCDEFGHIJK",
+    "https://youtu.be/ABCDEFGHIJK?t=3",
+    "https://youtu.be/ABCDEFGHIJK",
+])
+def test_extract_video_id_matches_urlparse(url):
+    assert extract_video_id(url) == urlparse_video_id(url)
+
+
+def test_shorts_trailing_slash_falls_back_to_urlparse():
+    url = "https://youtube.com/shorts/ABCDEFGHIJK/"
+    assert YOUTUBE_URL_RE.match(url) is None
+    assert extract_video_id(url) == ""